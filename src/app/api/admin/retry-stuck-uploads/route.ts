@@ -30,31 +30,30 @@ export async function POST() {
     
     console.log(`Found ${stuckFiles.length} stuck files, retrying...`)
     
-    // Retry each stuck file
-    const results = []
-    for (const file of stuckFiles) {
-      try {
-        await inngest.send({
-          name: 'imu/parse',
-          data: { fileId: file.id, userId: file.user_id }
-        })
-        
-        results.push({ 
-          fileId: file.id, 
-          filename: file.filename, 
-          status: 'retried' 
-        })
-        
-        console.log(`Retried file: ${file.filename} (${file.id})`)
-        
-      } catch (error) {
-        results.push({ 
-          fileId: file.id, 
-          filename: file.filename, 
-          status: 'failed',
-          error: error instanceof Error ? error.message : 'Unknown error'
-        })
-      }
+    // Retry all stuck files with a single batched send (one round-trip instead of N)
+    let results
+    try {
+      await inngest.send(stuckFiles.map(file => ({
+        name: 'imu/parse',
+        data: { fileId: file.id, userId: file.user_id }
+      })))
+
+      results = stuckFiles.map(file => ({
+        fileId: file.id,
+        filename: file.filename,
+        status: 'retried'
+      }))
+
+      console.log(`Retried files: ${stuckFiles.map(file => `${file.filename} (${file.id})`).join(', ')}`)
+
+    } catch (error) {
+      const message = error instanceof Error ? error.message : 'Unknown error'
+      results = stuckFiles.map(file => ({
+        fileId: file.id,
+        filename: file.filename,
+        status: 'failed',
+        error: message
+      }))
     }
     
     return Response.json({
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { createClient } from '@/lib/supabase/server'
 import { downsampleMultiSeries } from '@/lib/imu/lttb-downsample'
+import { fetchBatchesBounded } from '@/lib/imu/batched-fetch'
 
 export const dynamic = 'force-dynamic'
 
@@ -63,22 +64,17 @@ export async function GET(
     // Fetch data in batches to work around PostgREST's 1000-row limit
     const maxFetch = resolution === 'high' ? 50000 : 20000
     const BATCH_SIZE = 1000
-    const numBatches = Math.ceil(maxFetch / BATCH_SIZE)
-    
-    let samples: any[] = []
-    
-    for (let batch = 0; batch < numBatches; batch++) {
+
+    // Fetch one batch of samples for this file, with the time range filter applied if provided
+    const fetchBatch = (batch: number) => {
       const from = batch * BATCH_SIZE
       const to = from + BATCH_SIZE - 1
-      
+
       let query = supabase
         .from('imu_samples')
         .select('timestamp, accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z, mag_x, mag_y, mag_z')
         .eq('imu_file_id', id)
-        .order('timestamp', { ascending: true })
-        .range(from, to)
 
-      // Apply time range filter if provided
       if (start) {
         query = query.gte('timestamp', start)
       }
@@ -86,23 +82,22 @@ export async function GET(
         query = query.lte('timestamp', end)
       }
 
-      const { data: batchData, error: samplesError } = await query
+      return query
+        .order('timestamp', { ascending: true })
+        .range(from, to)
+    }
 
-      if (samplesError) {
-        console.error('Error fetching samples batch:', samplesError)
-        break
-      }
-      
-      if (!batchData || batchData.length === 0) {
-        break // No more data
-      }
-      
-      samples.push(...batchData)
-      
-      // If we got less than a full batch, we've reached the end
-      if (batchData.length < BATCH_SIZE) {
-        break
-      }
+    // Small zooms are served by the first batch alone; denser windows fetch the
+    // remaining batches with bounded concurrency
+    const numBatches = Math.ceil(maxFetch / BATCH_SIZE)
+    const { rows: samples, error: batchError } = await fetchBatchesBounded<any>(
+      numBatches,
+      BATCH_SIZE,
+      fetchBatch
+    )
+
+    if (batchError) {
+      console.error('Error fetching samples batch:', batchError)
     }
 
     const samplesError = samples.length === 0 ? new Error('No samples found') : null
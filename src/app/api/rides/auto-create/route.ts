@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { createClient } from '@/lib/supabase/server'
-import { TimeOverlapCalculator } from '@/lib/association/time-overlap-calculator'
+import { TimeOverlapCalculator, fetchImuTimeRange } from '@/lib/association/time-overlap-calculator'
 import { ConfidenceScorer } from '@/lib/association/confidence-scorer'
 import { AssociationConfig } from '@/lib/association/types'
 
@@ -93,50 +93,17 @@ export async function POST(request: NextRequest) {
     // Test each potential IMU file
     for (const imuFile of potentialImuFiles) {
       try {
-        // Get IMU data points for time range calculation
-        // Get total count first
-        const { count: totalCount } = await supabase
-          .from('imu_samples')
-          .select('*', { count: 'exact', head: true })
-          .eq('imu_file_id', imuFile.id)
-
-        // Fetch all IMU data points using pagination to handle Supabase 1k limit
-        let imuDataPoints: any[] = []
-        const PAGE_SIZE = 1000
-        
-        if (totalCount) {
-          const numPages = Math.ceil(totalCount / PAGE_SIZE)
-          
-          for (let page = 0; page < numPages; page++) {
-            const from = page * PAGE_SIZE
-            const to = from + PAGE_SIZE - 1
-            
-            const { data, error } = await supabase
-              .from('imu_samples')
-              .select('timestamp')
-              .eq('imu_file_id', imuFile.id)
-              .order('timestamp', { ascending: true })
-              .range(from, to)
-            
-            if (error) {
-              console.error('IMU data points query error:', error)
-              continue // Skip this IMU file and try the next one
-            }
-            
-            if (data) imuDataPoints.push(...data)
-          }
+        const { timeRange: imuTimeRange, error: timestampError } = await fetchImuTimeRange(supabase, imuFile.id)
+        if (timestampError) {
+          console.error('IMU data points query error:', timestampError)
+          continue // Skip this IMU file and try the next one
         }
 
-        if (!imuDataPoints || imuDataPoints.length === 0) {
+        if (!imuTimeRange) {
           continue
         }
 
-        // Calculate time range and overlap
-        // Convert timestamp to Date objects for the time range calculator
-        const imuDataWithTimestamps = imuDataPoints.map(point => ({
-          timestamp: new Date(point.timestamp)
-        }))
-        const imuTimeRange = TimeOverlapCalculator.extractImuTimeRange(imuDataWithTimestamps)
+        // Calculate overlap
         const overlap = TimeOverlapCalculator.calculateOverlap(imuTimeRange, fitTimeRange)
 
         if (!overlap) {
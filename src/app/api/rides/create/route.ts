@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { createClient } from '@/lib/supabase/server'
-import { TimeOverlapCalculator } from '@/lib/association/time-overlap-calculator'
+import { TimeOverlapCalculator, fetchImuTimeRange } from '@/lib/association/time-overlap-calculator'
 import { ConfidenceScorer } from '@/lib/association/confidence-scorer'
 import { AssociationConfig } from '@/lib/association/types'
 
@@ -44,43 +44,16 @@ export async function POST(request: NextRequest) {
       return NextResponse.json({ error: 'IMU file not found' }, { status: 404 })
     }
 
-    // Get total count first
-    const { count: totalCount } = await supabase
-      .from('imu_samples')
-      .select('*', { count: 'exact', head: true })
-      .eq('imu_file_id', imuFileId)
-
-    // Fetch all IMU data points using pagination to handle Supabase 1k limit
-    let imuDataPoints: any[] = []
-    const PAGE_SIZE = 1000
-    
-    if (totalCount) {
-      const numPages = Math.ceil(totalCount / PAGE_SIZE)
-      
-      for (let page = 0; page < numPages; page++) {
-        const from = page * PAGE_SIZE
-        const to = from + PAGE_SIZE - 1
-        
-        const { data, error } = await supabase
-          .from('imu_samples')
-          .select('timestamp')
-          .eq('imu_file_id', imuFileId)
-          .order('timestamp', { ascending: true })
-          .range(from, to)
-        
-        if (error) {
-          console.error('IMU data points query error:', error)
-          return NextResponse.json({ 
-            error: 'Failed to query IMU data points',
-            details: error.message 
-          }, { status: 500 })
-        }
-        
-        if (data) imuDataPoints.push(...data)
-      }
+    const { timeRange: imuTimeRange, error: timestampError } = await fetchImuTimeRange(supabase, imuFileId)
+    if (timestampError) {
+      console.error('IMU data points query error:', timestampError)
+      return NextResponse.json({ 
+        error: 'Failed to query IMU data points',
+        details: timestampError.message 
+      }, { status: 500 })
     }
 
-    if (!imuDataPoints || imuDataPoints.length === 0) {
+    if (!imuTimeRange) {
       return NextResponse.json({ error: 'No IMU data points found' }, { status: 404 })
     }
 
@@ -97,11 +70,6 @@ export async function POST(request: NextRequest) {
     }
 
     // Extract time ranges
-    // Convert timestamp to Date objects for the time range calculator
-    const imuDataWithTimestamps = imuDataPoints.map(point => ({
-      timestamp: new Date(point.timestamp)
-    }))
-    const imuTimeRange = TimeOverlapCalculator.extractImuTimeRange(imuDataWithTimestamps)
     const fitTimeRange = TimeOverlapCalculator.extractFitTimeRange({
       start_time: fitFile.start_time,
       timestamp: fitFile.end_time, // Map end_time to timestamp for the function
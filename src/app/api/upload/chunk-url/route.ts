@@ -1,6 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { createClient } from '@supabase/supabase-js'
-import { inngest } from '@/inngest/client'
 
 export const dynamic = 'force-dynamic'
 
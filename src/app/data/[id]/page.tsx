@@ -3,6 +3,7 @@ import { redirect, notFound } from 'next/navigation'
 import { IMUUPlotCharts } from '@/components/imu-uplot-charts'
 import { DataDetailHeader } from '@/components/data-detail-header'
 import { downsampleMultiSeries } from '@/lib/imu/lttb-downsample'
+import { fetchBatchesBounded } from '@/lib/imu/batched-fetch'
 import { Loader2 } from 'lucide-react'
 
 export default async function DataDetailPage({ params }: { params: Promise<{ id: string }> }) {
@@ -50,17 +51,23 @@ export default async function DataDetailPage({ params }: { params: Promise<{ id:
       // Small dataset: fetch all data in one or more pages
       const numPages = Math.ceil(totalCount / PAGE_SIZE)
       
-      for (let page = 0; page < numPages; page++) {
-        const from = page * PAGE_SIZE
-        const to = from + PAGE_SIZE - 1
-        
-        const { data, error } = await supabase
-          .from('imu_samples')
-          .select('timestamp, accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z, mag_x, mag_y, mag_z')
-          .eq('imu_file_id', id)
-          .order('timestamp', { ascending: true })
-          .range(from, to)
-        
+      // Page offsets are known up front, so fetch every page concurrently and
+      // reassemble them in order
+      const pages = await Promise.all(
+        Array.from({ length: numPages }, (_, page) => {
+          const from = page * PAGE_SIZE
+          const to = from + PAGE_SIZE - 1
+          
+          return supabase
+            .from('imu_samples')
+            .select('timestamp, accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z, mag_x, mag_y, mag_z')
+            .eq('imu_file_id', id)
+            .order('timestamp', { ascending: true })
+            .range(from, to)
+        })
+      )
+      
+      for (const { data, error } of pages) {
         if (error) break
         if (data) samplesData.push(...data)
       }
@@ -73,29 +80,27 @@ export default async function DataDetailPage({ params }: { params: Promise<{ id:
       const BATCH_SIZE = 1000
       const numBatches = Math.ceil(TARGET_SAMPLES / BATCH_SIZE)
       
-      for (let batch = 0; batch < numBatches; batch++) {
+      // Every call re-runs the full-file stride sample before .range() slices it,
+      // so keep the number of calls in flight bounded
+      const { rows } = await fetchBatchesBounded<any>(numBatches, BATCH_SIZE, (batch) => {
         const batchStart = batch * BATCH_SIZE
         const batchLimit = Math.min(BATCH_SIZE, TARGET_SAMPLES - batchStart)
         
         // Calculate offset in terms of actual rows (stride * batchStart)
-        const { data, error } = await supabase
+        return supabase
           .rpc('sample_imu_data', {
             p_file_id: id,
             p_stride: stride,
             p_limit: TARGET_SAMPLES // Still pass full limit to function
           })
           .range(batchStart, batchStart + batchLimit - 1) // Fetch this batch's slice
-        
-        if (error || !data) break
-        
-        // Map sample_timestamp back to timestamp for consistency
-        const mappedData = data.map((row: any) => ({
-          ...row,
-          timestamp: row.sample_timestamp
-        }))
-        
-        samplesData.push(...mappedData)
-      }
+      })
+      
+      // Map sample_timestamp back to timestamp for consistency
+      samplesData = rows.map((row: any) => ({
+        ...row,
+        timestamp: row.sample_timestamp
+      }))
     }
 
     if (samplesData.length > 0) {
@@ -4,7 +4,7 @@ import { useState, useCallback } from 'react'
 import { useDropzone } from 'react-dropzone'
 import { useRouter } from 'next/navigation'
 import { createClient } from '@/lib/supabase/client'
-import { Upload, FileText } from 'lucide-react'
+import { Upload } from 'lucide-react'
 import { ConfirmationModal, UploadProgressModal } from '@/components/upload-modals'
 import { FileChunker } from '@/lib/upload/chunking'
 import { useToast } from '@/components/ui/toast-context'
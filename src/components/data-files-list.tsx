@@ -135,6 +135,10 @@ export function DataFilesList({ files: initialFiles, onDataChange }: DataFilesLi
 
     // Poll continuously while any files are processing
     const interval = setInterval(async () => {
+      // Skip polls while the tab is in the background - nobody is watching the
+      // progress, and the first visible tick picks up the latest state
+      if (document.visibilityState === 'hidden') return
+
       const supabase = createClient()
       
       // Get current list of processing files using latest state
@@ -157,8 +161,10 @@ export function DataFilesList({ files: initialFiles, onDataChange }: DataFilesLi
             }
 
             if (updatedFiles) {
+              // Index once so each row lookup is O(1) rather than a scan of the results
+              const updatesById = new Map(updatedFiles.map(f => [f.id, f]))
               setFiles(prev => prev.map(file => {
-                const updated = updatedFiles.find(f => f.id === file.id)
+                const updated = updatesById.get(file.id)
                 if (updated) {
                   // Log status changes
                   if (updated.status !== file.status) {
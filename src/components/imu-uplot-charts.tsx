@@ -26,6 +26,17 @@ interface IMUUPlotChartsProps {
 
 type DataType = 'accel' | 'gyro' | 'mag'
 
+type AxisKey = Exclude<keyof IMUSample, 'timestamp'>
+
+// Sample fields plotted as the X/Y/Z series for each data type
+const AXIS_KEYS: Record<DataType, [AxisKey, AxisKey, AxisKey]> = {
+  accel: ['accel_x', 'accel_y', 'accel_z'],
+  gyro: ['gyro_x', 'gyro_y', 'gyro_z'],
+  mag: ['mag_x', 'mag_y', 'mag_z']
+}
+
+const AXIS_LABELS = ['X', 'Y', 'Z']
+
 export function IMUUPlotCharts({ fileId, initialSamples, originalCount }: IMUUPlotChartsProps) {
   const [dataType, setDataType] = useState<DataType>('accel')
   const [samples, setSamples] = useState<IMUSample[]>(initialSamples)
@@ -99,57 +110,41 @@ export function IMUUPlotCharts({ fileId, initialSamples, originalCount }: IMUUPl
   useEffect(() => {
     if (!chartRef.current || samples.length === 0) return
 
-    // Convert samples to uPlot format
-    const timestamps = samples.map(s => new Date(s.timestamp).getTime() / 1000) // Unix seconds
+    // Convert samples (array of row objects) to uPlot's column arrays in a single
+    // pass, preallocated to the sample count, instead of one .map per column
+    const [xKey, yKey, zKey] = AXIS_KEYS[dataType]
+    const sampleCount = samples.length
+    const timestamps = new Array<number>(sampleCount)
+    const xValues = new Array<number | null>(sampleCount)
+    const yValues = new Array<number | null>(sampleCount)
+    const zValues = new Array<number | null>(sampleCount)
+
+    for (let i = 0; i < sampleCount; i++) {
+      const sample = samples[i]
+      timestamps[i] = new Date(sample.timestamp).getTime() / 1000 // Unix seconds
+      xValues[i] = sample[xKey] ?? null
+      yValues[i] = sample[yKey] ?? null
+      zValues[i] = sample[zKey] ?? null
+    }
+
+    const data: uPlot.AlignedData = [timestamps, xValues, yValues, zValues]
+    const series: uPlot.Series[] = [
+      {}, // Timestamp series (no label, no stroke - won't show in legend)
+      { label: 'X', stroke: 'hsl(0, 70%, 50%)', width: 2 },
+      { label: 'Y', stroke: 'hsl(120, 70%, 40%)', width: 2 },
+      { label: 'Z', stroke: 'hsl(210, 70%, 50%)', width: 2 }
+    ]
 
-    let series: uPlot.Series[]
-    let data: uPlot.AlignedData
     let yAxisLabel: string
 
     switch (dataType) {
       case 'accel':
-        data = [
-          timestamps,
-          samples.map(s => s.accel_x),
-          samples.map(s => s.accel_y),
-          samples.map(s => s.accel_z)
-        ]
-        series = [
-          {}, // Timestamp series (no label, no stroke - won't show in legend)
-          { label: 'X', stroke: 'hsl(0, 70%, 50%)', width: 2 },
-          { label: 'Y', stroke: 'hsl(120, 70%, 40%)', width: 2 },
-          { label: 'Z', stroke: 'hsl(210, 70%, 50%)', width: 2 }
-        ]
         yAxisLabel = 'Acceleration (m/s²)'
         break
       case 'gyro':
-        data = [
-          timestamps,
-          samples.map(s => s.gyro_x),
-          samples.map(s => s.gyro_y),
-          samples.map(s => s.gyro_z)
-        ]
-        series = [
-          {}, // Timestamp series (no label, no stroke - won't show in legend)
-          { label: 'X', stroke: 'hsl(0, 70%, 50%)', width: 2 },
-          { label: 'Y', stroke: 'hsl(120, 70%, 40%)', width: 2 },
-          { label: 'Z', stroke: 'hsl(210, 70%, 50%)', width: 2 }
-        ]
         yAxisLabel = 'Angular Velocity (rad/s)'
         break
       case 'mag':
-        data = [
-          timestamps,
-          samples.map(s => s.mag_x ?? null),
-          samples.map(s => s.mag_y ?? null),
-          samples.map(s => s.mag_z ?? null)
-        ]
-        series = [
-          {}, // Timestamp series (no label, no stroke - won't show in legend)
-          { label: 'X', stroke: 'hsl(0, 70%, 50%)', width: 2 },
-          { label: 'Y', stroke: 'hsl(120, 70%, 40%)', width: 2 },
-          { label: 'Z', stroke: 'hsl(210, 70%, 50%)', width: 2 }
-        ]
         yAxisLabel = 'Magnetic Field (µT)'
         break
     }
@@ -348,39 +343,25 @@ export function IMUUPlotCharts({ fileId, initialSamples, originalCount }: IMUUPl
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [])
 
-  // Calculate stats
+  // Calculate stats - min/max/mean for each axis in one fused pass over the
+  // samples, without materializing per-axis value arrays
   const calculateStats = () => {
-    let values: { [key: string]: number[] } = {}
-    
-    switch (dataType) {
-      case 'accel':
-        values = {
-          'X': samples.map(s => s.accel_x),
-          'Y': samples.map(s => s.accel_y),
-          'Z': samples.map(s => s.accel_z)
-        }
-        break
-      case 'gyro':
-        values = {
-          'X': samples.map(s => s.gyro_x),
-          'Y': samples.map(s => s.gyro_y),
-          'Z': samples.map(s => s.gyro_z)
-        }
-        break
-      case 'mag':
-        values = {
-          'X': samples.map(s => s.mag_x).filter(v => v !== null) as number[],
-          'Y': samples.map(s => s.mag_y).filter(v => v !== null) as number[],
-          'Z': samples.map(s => s.mag_z).filter(v => v !== null) as number[]
-        }
-        break
-    }
+    return AXIS_KEYS[dataType].map((key, index) => {
+      let min = Infinity
+      let max = -Infinity
+      let sum = 0
+      let count = 0
+
+      for (const sample of samples) {
+        const value = sample[key]
+        if (value === null || value === undefined) continue
+        if (value < min) min = value
+        if (value > max) max = value
+        sum += value
+        count++
+      }
 
-    return Object.entries(values).map(([axis, vals]) => {
-      const min = Math.min(...vals)
-      const max = Math.max(...vals)
-      const mean = vals.reduce((a, b) => a + b, 0) / vals.length
-      return { axis, min, max, mean }
+      return { axis: AXIS_LABELS[index], min, max, mean: sum / count }
     })
   }
 
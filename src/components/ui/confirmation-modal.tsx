@@ -1,6 +1,5 @@
 'use client'
 
-import React from 'react'
 import { X, AlertTriangle, Trash2, CheckCircle2 } from 'lucide-react'
 
 export type ConfirmationType = 'delete' | 'warning' | 'success'
@@ -1,6 +1,5 @@
 'use client'
 
-import React from 'react'
 import { X, CheckCircle2, AlertCircle, AlertTriangle, Info, Copy } from 'lucide-react'
 import { Toast, useToast } from './toast-context'
 
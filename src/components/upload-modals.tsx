@@ -1,6 +1,5 @@
 'use client'
 
-import { useState } from 'react'
 import { FileText, X, Upload, Loader2 } from 'lucide-react'
 
 interface FileToUpload {
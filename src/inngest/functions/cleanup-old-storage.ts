@@ -1,6 +1,9 @@
 import { inngest } from '../client'
 import { createClient } from '@supabase/supabase-js'
 
+// Number of files whose storage is removed concurrently
+const CLEANUP_CONCURRENCY = 8
+
 /**
  * Cleanup old storage files after 30 days
  * Runs daily to remove CSV files from Supabase Storage for files that were successfully parsed 30+ days ago
@@ -51,10 +54,9 @@ export const cleanupOldStorage = inngest.createFunction(
     }
 
     // Step 2: Delete storage files
-    let cleaned = 0
-    let failed = 0
-
-    for (const file of filesResult) {
+    // Each file's storage removal is independent, so run them a few at a time
+    // instead of strictly one after another
+    const cleanupFile = async (file: typeof filesResult[number]): Promise<boolean> => {
       try {
         console.log(`🗑️ Cleaning up storage for file ${file.id}: ${file.filename}`)
 
@@ -69,8 +71,7 @@ export const cleanupOldStorage = inngest.createFunction(
 
           if (listError) {
             console.error(`❌ Failed to list chunks for ${file.id}:`, listError)
-            failed++
-            continue
+            return false
           }
 
           if (chunkList && chunkList.length > 0) {
@@ -82,8 +83,7 @@ export const cleanupOldStorage = inngest.createFunction(
 
             if (deleteError) {
               console.error(`❌ Failed to delete chunks for ${file.id}:`, deleteError)
-              failed++
-              continue
+              return false
             }
 
             console.log(`✅ Deleted ${chunkPaths.length} chunks for ${file.filename}`)
@@ -96,33 +96,54 @@ export const cleanupOldStorage = inngest.createFunction(
 
           if (deleteError) {
             console.error(`❌ Failed to delete storage file for ${file.id}:`, deleteError)
-            failed++
-            continue
+            return false
           }
 
           console.log(`✅ Deleted storage file for ${file.filename}`)
         }
 
-        // Update database to mark storage as cleaned
+        return true
+
+      } catch (error) {
+        console.error(`❌ Error cleaning file ${file.id}:`, error)
+        return false
+      }
+    }
+
+    let cleaned = 0
+    let failed = 0
+
+    for (let i = 0; i < filesResult.length; i += CLEANUP_CONCURRENCY) {
+      const batch = filesResult.slice(i, i + CLEANUP_CONCURRENCY)
+      const outcomes = await Promise.all(batch.map(cleanupFile))
+
+      const cleanedIds: string[] = []
+      outcomes.forEach((ok, index) => {
+        if (ok) {
+          cleanedIds.push(batch[index].id)
+        } else {
+          failed++
+        }
+      })
+
+      // Step 3: Mark storage as cleaned for this slice in a single update, so the id
+      // list stays small and finished work is recorded as the loop progresses
+      if (cleanedIds.length > 0) {
         const { error: updateError } = await supabaseAdmin
           .from('imu_data_files')
           .update({ 
             storage_path: null,
             chunk_count: null
           })
-          .eq('id', file.id)
+          .in('id', cleanedIds)
 
         if (updateError) {
-          console.error(`⚠️ Failed to update storage_path for ${file.id}:`, updateError)
+          console.error(`⚠️ Failed to update storage_path for ${cleanedIds.length} files:`, updateError)
           // Non-critical, storage is deleted anyway
         }
-
-        cleaned++
-
-      } catch (error) {
-        console.error(`❌ Error cleaning file ${file.id}:`, error)
-        failed++
       }
+
+      cleaned += cleanedIds.length
     }
 
     console.log(`✅ Cleanup complete: ${cleaned} files cleaned, ${failed} failed`)
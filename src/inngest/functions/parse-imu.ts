@@ -1,6 +1,6 @@
 import { inngest } from '../client'
 import { parseIMUCSVStreaming, StreamingParseOptions } from '@/lib/imu/streaming-parser'
-import { createClient } from '@supabase/supabase-js'
+import { createClient, SupabaseClient } from '@supabase/supabase-js'
 import { IMUSample } from '@/lib/imu/types'
 
 // Batch size: 1k for local dev, 10k for production
@@ -8,18 +8,33 @@ import { IMUSample } from '@/lib/imu/types'
 // Larger batches improve performance in production
 const BATCH_SIZE = process.env.NODE_ENV === 'production' ? 10000 : 1000
 
-// Create Supabase admin client lazily (only when function runs)
+// Retry policy for transient batch insert failures. Worst case per batch is
+// INSERT_MAX_ATTEMPTS x INSERT_TIMEOUT_MS plus ~1.5s of backoff (~92s). Every batch
+// runs inside the single download-parse-process step, so the 15m finish budget
+// absorbs a handful of exhausted batches; a database that keeps timing out
+// fails the run at the budget instead of retrying indefinitely.
+const INSERT_MAX_ATTEMPTS = 3
+const INSERT_RETRY_BASE_MS = 500
+const INSERT_TIMEOUT_MS = 30000
+
+let supabaseAdminClient: SupabaseClient | null = null
+
+// Create Supabase admin client lazily (only when function runs) and reuse it
+// across invocations on a warm instance instead of rebuilding it per event
 function getSupabaseAdmin() {
-  return createClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.SUPABASE_SERVICE_ROLE_KEY!, // Service role key for admin access
-    {
-      auth: {
-        autoRefreshToken: false,
-        persistSession: false
+  if (!supabaseAdminClient) {
+    supabaseAdminClient = createClient(
+      process.env.NEXT_PUBLIC_SUPABASE_URL!,
+      process.env.SUPABASE_SERVICE_ROLE_KEY!, // Service role key for admin access
+      {
+        auth: {
+          autoRefreshToken: false,
+          persistSession: false
+        }
       }
-    }
-  )
+    )
+  }
+  return supabaseAdminClient
 }
 
 /**
@@ -251,25 +266,54 @@ export const parseIMU = inngest.createFunction(
             }))
 
             // Insert with timeout to detect hanging
-            console.log(`🔄 Inserting batch of ${rows.length} samples...`)
             const insertStart = Date.now()
             
-            // Add timeout to prevent hanging
-            const insertPromise = supabaseAdmin
-              .from('imu_samples')
-              .upsert(rows, { 
-                onConflict: 'user_id,imu_file_id,timestamp',
-                ignoreDuplicates: false
-              })
-            
-            const timeoutPromise = new Promise((_, reject) => 
-              setTimeout(() => reject(new Error('Database insert timeout after 30 seconds')), 30000)
-            )
-            
-            const { error } = await Promise.race([insertPromise, timeoutPromise]) as any
+            // Upserts are idempotent on (user_id, imu_file_id, timestamp), so transient
+            // failures (timeouts, 429/5xx from the pooler) are retried with backoff
+            // instead of failing the step and re-parsing the whole file
+            let error: any = null
+            for (let attempt = 1; attempt <= INSERT_MAX_ATTEMPTS; attempt++) {
+              // Abort the request on timeout so we stop waiting and free the socket.
+              // This does not cancel a statement already running in Postgres, so a
+              // retry can still wait on that statement's row locks
+              const controller = new AbortController()
+              let timedOut = false
+              const timeoutId = setTimeout(() => {
+                timedOut = true
+                controller.abort()
+              }, INSERT_TIMEOUT_MS)
+              
+              let status = 0
+              try {
+                ({ error, status } = await supabaseAdmin
+                  .from('imu_samples')
+                  .upsert(rows, { 
+                    onConflict: 'user_id,imu_file_id,timestamp',
+                    ignoreDuplicates: false
+                  })
+                  .abortSignal(controller.signal))
+              } catch (insertError) {
+                error = insertError
+                status = 0
+              } finally {
+                clearTimeout(timeoutId)
+              }
+              
+              if (timedOut) {
+                error = new Error('Database insert timeout after 30 seconds')
+                status = 0
+              }
+              
+              const isTransient = !status || status === 429 || status >= 500
+              if (!error || !isTransient || attempt === INSERT_MAX_ATTEMPTS) break
+              
+              // Exponential backoff with jitter: ~0.5s, ~1s, ...
+              const delay = INSERT_RETRY_BASE_MS * 2 ** (attempt - 1) + Math.random() * INSERT_RETRY_BASE_MS
+              console.warn(`⚠️ Batch insert attempt ${attempt} failed (${error.message}), retrying in ${Math.round(delay)}ms...`)
+              await new Promise(resolve => setTimeout(resolve, delay))
+            }
             
             const insertDuration = Date.now() - insertStart
-            console.log(`✅ Batch inserted in ${insertDuration}ms`)
 
             if (error) {
               console.error(`❌ Batch insert failed for ${fileId}:`, error)
@@ -291,8 +335,6 @@ export const parseIMU = inngest.createFunction(
             if (progressError) {
               console.error(`⚠️ Failed to update progress checkpoint: ${progressError.message}`)
               // Don't fail the entire process, just log the warning
-            } else {
-              console.log(`📊 Progress checkpoint updated: ${totalProcessed} samples`)
             }
 
             // Log batch to streaming_processing_logs for detailed monitoring
@@ -315,7 +357,9 @@ export const parseIMU = inngest.createFunction(
               // Don't fail the entire process, just log the warning
             }
 
-            console.log(`✅ Batch ${batchNumber} processed: ${samples.length} samples in ${batchDuration}ms (${totalProcessed} total)`)
+            // One summary line per batch (insert timing + checkpoint) instead of a
+            // line per stage - keeps function logs readable and cheap on big files
+            console.log(`✅ Batch ${batchNumber} processed: ${samples.length} samples in ${batchDuration}ms (insert ${insertDuration}ms, ${totalProcessed} total)`)
             
             // Yield control to event loop to prevent blocking Next.js server
             await new Promise(resolve => setImmediate(resolve))
@@ -495,55 +539,19 @@ export const parseIMU = inngest.createFunction(
         // COMPENSATION: Clean up any orphaned samples before marking as failed
         console.log(`🧹 Cleaning up orphaned samples for failed streaming file ${fileId}`)
         
-        const { data: orphanedSamples, error: countError } = await supabaseAdmin
+        // Delete all orphaned samples server-side in one query; Prefer: count=exact
+        // returns the number of rows removed, so no separate count scan is needed
+        const { count: deletedCount, error: deleteError } = await supabaseAdmin
           .from('imu_samples')
-          .select('id')
+          .delete({ count: 'exact' })
           .eq('imu_file_id', fileId)
-          .limit(1) // Just check if any exist
         
-        if (countError) {
-          console.error('Failed to check for orphaned samples:', countError)
-        } else if (orphanedSamples && orphanedSamples.length > 0) {
-          console.log(`🗑️ Found orphaned samples for streaming file ${fileId}, cleaning up...`)
-          
-          // Delete orphaned samples in batches
-          let deletedCount = 0
-          const BATCH_SIZE = 10000
-          let hasMore = true
-          
-          while (hasMore) {
-            const { data: sampleBatch, error: fetchError } = await supabaseAdmin
-              .from('imu_samples')
-              .select('id')
-              .eq('imu_file_id', fileId)
-              .limit(BATCH_SIZE)
-            
-            if (fetchError || !sampleBatch || sampleBatch.length === 0) {
-              hasMore = false
-              break
-            }
-            
-            const { error: deleteError } = await supabaseAdmin
-              .from('imu_samples')
-              .delete()
-              .in('id', sampleBatch.map(s => s.id))
-            
-            if (deleteError) {
-              console.error('Failed to delete orphaned sample batch:', deleteError)
-              break
-            }
-            
-            deletedCount += sampleBatch.length
-            console.log(`✅ Cleaned up ${deletedCount} orphaned samples`)
-            
-            if (sampleBatch.length < BATCH_SIZE) {
-              hasMore = false
-            }
-          }
-          
-          console.log(`✅ Cleanup complete: ${deletedCount} orphaned samples removed`)
-        } else {
+        if (deleteError) {
+          console.error('Failed to delete orphaned samples:', deleteError)
+        } else if (deletedCount === 0) {
           console.log(`✅ No orphaned samples found for streaming file ${fileId}`)
+        } else {
+          console.log(`✅ Cleanup complete: ${deletedCount} orphaned samples removed for streaming file ${fileId}`)
         }
         
         // Now update the file status to failed and reset progress tracking
@@ -2,6 +2,7 @@
  * Time overlap calculator for IMU-FIT file associations
  */
 
+import { PostgrestError, SupabaseClient } from '@supabase/supabase-js'
 import { TimeRange, AssociationOverlap, ImuDataPoint, FitSessionData } from './types'
 
 export class TimeOverlapCalculator {
@@ -48,9 +49,19 @@ export class TimeOverlapCalculator {
       throw new Error('IMU data is empty')
     }
     
-    const timestamps = imuData.map(point => new Date(point.timestamp))
-    const start = new Date(Math.min(...timestamps.map(t => t.getTime())))
-    const end = new Date(Math.max(...timestamps.map(t => t.getTime())))
+    // Single pass over epoch millis - avoids building intermediate Date/number
+    // arrays and spreading them into Math.min/max (which overflows on large inputs)
+    let startMs = Infinity
+    let endMs = -Infinity
+    for (const point of imuData) {
+      const ms = point.timestamp instanceof Date
+        ? point.timestamp.getTime()
+        : new Date(point.timestamp).getTime()
+      if (ms < startMs) startMs = ms
+      if (ms > endMs) endMs = ms
+    }
+    const start = new Date(startMs)
+    const end = new Date(endMs)
     
     return {
       start,
@@ -148,3 +159,53 @@ export class TimeOverlapCalculator {
     }
   }
 }
+
+/**
+ * Fetch the time range of an IMU file's samples
+ *
+ * Only the first and last timestamps are needed, so this fetches those two rows
+ * instead of paging through every sample. `timeRange` is null when the file has
+ * no samples.
+ */
+export async function fetchImuTimeRange(
+  supabase: SupabaseClient,
+  imuFileId: string
+): Promise<{ timeRange: TimeRange | null; error: PostgrestError | null }> {
+  const [firstSample, lastSample] = await Promise.all([
+    supabase
+      .from('imu_samples')
+      .select('timestamp')
+      .eq('imu_file_id', imuFileId)
+      .order('timestamp', { ascending: true })
+      .limit(1),
+    supabase
+      .from('imu_samples')
+      .select('timestamp')
+      .eq('imu_file_id', imuFileId)
+      .order('timestamp', { ascending: false })
+      .limit(1)
+  ])
+
+  const error = firstSample.error || lastSample.error
+  if (error) {
+    return { timeRange: null, error }
+  }
+
+  const first = firstSample.data?.[0]
+  const last = lastSample.data?.[0]
+  if (!first || !last) {
+    return { timeRange: null, error: null }
+  }
+
+  const start = new Date(first.timestamp)
+  const end = new Date(last.timestamp)
+
+  return {
+    timeRange: {
+      start,
+      end,
+      duration: end.getTime() - start.getTime()
+    },
+    error: null
+  }
+}
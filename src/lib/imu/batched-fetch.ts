@@ -0,0 +1,66 @@
+/**
+ * Bounded-concurrency batch fetching for IMU sample reads
+ *
+ * PostgREST caps each response at 1000 rows, so large reads are split into
+ * range batches. Sending every batch at once saturates the connection pool,
+ * while sending them one at a time serializes every round-trip.
+ */
+
+// Maximum number of batch requests in flight at once
+export const BATCH_FETCH_CONCURRENCY = 4
+
+interface BatchResult<T> {
+  data: T[] | null
+  error: unknown
+}
+
+/**
+ * Fetch up to `numBatches` batches and concatenate them in order
+ *
+ * Batch 0 is fetched on its own because most reads fit in a single batch;
+ * later batches go out BATCH_FETCH_CONCURRENCY at a time. Fetching stops at
+ * the first failed, empty or short batch.
+ *
+ * @param numBatches - Maximum number of batches to fetch
+ * @param batchSize - Number of rows in a full batch
+ * @param fetchBatch - Issues the query for a batch index
+ * @returns Rows fetched before stopping, and the error that stopped fetching (if any)
+ */
+export async function fetchBatchesBounded<T>(
+  numBatches: number,
+  batchSize: number,
+  fetchBatch: (batch: number) => PromiseLike<BatchResult<T>>
+): Promise<{ rows: T[]; error: unknown }> {
+  const rows: T[] = []
+  let next = 0
+  let windowSize = 1
+
+  while (next < numBatches) {
+    const size = Math.min(windowSize, numBatches - next)
+    const results = await Promise.all(
+      Array.from({ length: size }, (_, offset) => fetchBatch(next + offset))
+    )
+
+    for (const { data, error } of results) {
+      if (error) {
+        return { rows, error }
+      }
+
+      if (!data || data.length === 0) {
+        return { rows, error: null } // No more data
+      }
+
+      rows.push(...data)
+
+      // If we got less than a full batch, we've reached the end
+      if (data.length < batchSize) {
+        return { rows, error: null }
+      }
+    }
+
+    next += size
+    windowSize = BATCH_FETCH_CONCURRENCY
+  }
+
+  return { rows, error: null }
+}
@@ -30,6 +30,13 @@ export function downsampleLTTB<T extends DataPoint>(
   const dataLength = data.length
   const bucketSize = (dataLength - 2) / (threshold - 2)
 
+  // Parse every timestamp once up front - the bucket loops below would
+  // otherwise re-parse most points (ISO strings from the API) twice
+  const timestamps = new Float64Array(dataLength)
+  for (let i = 0; i < dataLength; i++) {
+    timestamps[i] = getTimestamp(data[i])
+  }
+
   const sampled: T[] = []
   sampled.push(data[0]) // Always include first point
 
@@ -48,7 +55,7 @@ export function downsampleLTTB<T extends DataPoint>(
     const avgRangeLength = avgRangeEnd - avgRangeStart
 
     for (let j = avgRangeStart; j < avgRangeEnd; j++) {
-      avgX += getTimestamp(data[j])
+      avgX += timestamps[j]
     }
     avgX /= avgRangeLength
 
@@ -57,7 +64,7 @@ export function downsampleLTTB<T extends DataPoint>(
     const rangeTo = Math.floor((i + 1) * bucketSize) + 1
 
     // Point a (previous selected point)
-    const pointAX = getTimestamp(data[sampledIndex])
+    const pointAX = timestamps[sampledIndex]
 
     let maxArea = -1
     let maxAreaPoint: T | null = null
@@ -65,7 +72,7 @@ export function downsampleLTTB<T extends DataPoint>(
 
     for (let j = rangeOffs; j < rangeTo; j++) {
       // Calculate triangle area over three buckets
-      const pointBX = getTimestamp(data[j])
+      const pointBX = timestamps[j]
 
       // Calculate the area of the triangle formed by point a, this point, and the average of the next bucket
       // Area = 0.5 * |x1(y2 - y3) + x2(y3 - y1) + x3(y1 - y2)|
@@ -109,51 +116,17 @@ function getTimestamp(point: DataPoint): number {
 
 /**
  * Downsample multiple series data (e.g., X/Y/Z axes) consistently
- * Uses the same sampling points for all series based on primary metric
+ * Uses the same sampling points for all series
  * 
  * @param data - Array of data points
  * @param threshold - Target number of points
- * @param primaryMetric - Metric to use for LTTB calculation (default: first numeric field)
  * @returns Downsampled array with all fields preserved
  */
 export function downsampleMultiSeries<T extends DataPoint>(
   data: T[],
-  threshold: number,
-  primaryMetric?: keyof T
+  threshold: number
 ): T[] {
-  if (threshold >= data.length || threshold <= 2) {
-    return data
-  }
-
-  // For multi-series IMU data, we want to preserve the same time points
-  // across all axes, so we use LTTB on the magnitude or a primary metric
-  
-  // If no primary metric specified, calculate magnitude from first 3 numeric fields
-  if (!primaryMetric) {
-    const numericFields = Object.keys(data[0]).filter(
-      key => key !== 'timestamp' && typeof data[0][key] === 'number'
-    )
-    
-    if (numericFields.length >= 3) {
-      // Calculate magnitude for LTTB (preserves peaks across all axes)
-      const dataWithMagnitude = data.map(point => {
-        const x = point[numericFields[0]] as number
-        const y = point[numericFields[1]] as number
-        const z = point[numericFields[2]] as number
-        return {
-          ...point,
-          _magnitude: Math.sqrt(x * x + y * y + z * z)
-        }
-      })
-      
-      const sampled = downsampleLTTB(dataWithMagnitude, threshold)
-      
-      // Remove temporary magnitude field
-      return sampled.map(({ _magnitude, ...rest }) => rest as unknown as T)
-    }
-  }
-
-  // Fallback to simple LTTB on primary metric or first field
+  // Known gap: downsampleLTTB uses the point index as the triangle's y value and
+  // never reads the sample values, so selection ignores the data (peaks included)
   return downsampleLTTB(data, threshold)
 }
-
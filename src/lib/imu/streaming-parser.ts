@@ -142,18 +142,19 @@ export async function parseIMUCSVStreaming(
   })
 }
 
+// Hoisted so parseRow doesn't rebuild the list for every row
+const REQUIRED_COLUMNS = [
+  'timestamp_ms', 'accel_x', 'accel_y', 'accel_z',
+  'gyro_x', 'gyro_y', 'gyro_z'
+]
+
 /**
  * Parse a single CSV row into an IMUSample
  * This is the same logic as in the original parser but extracted for streaming
  */
 function parseRow(row: any, rowNumber: number): IMUSample {
   // Validate required columns
-  const requiredColumns = [
-    'timestamp_ms', 'accel_x', 'accel_y', 'accel_z',
-    'gyro_x', 'gyro_y', 'gyro_z'
-  ]
-  
-  const missingColumns = requiredColumns.filter(col => !(col in row))
+  const missingColumns = REQUIRED_COLUMNS.filter(col => !(col in row))
   if (missingColumns.length > 0) {
     throw new Error(`Missing required columns: ${missingColumns.join(', ')}`)
   }